@@ -11,8 +11,117 @@ versioneer.lookupfile = '.versioneer-lookup'
 
 from setuptools import setup, find_packages, Command
 import os
+import sys
 import shutil
 import glob
+import subprocess
+
+VERSIONEER_CACHE_FILE = os.path.join("build", ".versioneer-cache.json")
+_versioneer_memo = dict()
+
+def _versioneer_cache_key():
+	import hashlib
+
+	root = versioneer.get_root()
+	git_dir = os.path.join(root, ".git")
+	if not os.path.isdir(git_dir):
+		return None
+
+	head = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=root).strip()
+
+	# modified tracked files make versioneer report a -dirty version, so the working tree state has to be part of the key
+	status = subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root)
+	dirty = hashlib.sha1(status).hexdigest() if status.strip() else "clean"
+
+	# branch, tags and lookup file all influence the version versioneer computes
+	with open(os.path.join(git_dir, "HEAD")) as f:
+		ref = f.read().strip()
+
+	mtimes = []
+	for path in (os.path.join(git_dir, "packed-refs"),
+	             os.path.join(root, versioneer.lookupfile)):
+		mtimes.append(str(os.path.getmtime(path)) if os.path.exists(path) else "-")
+
+	# tags may live in sub folders of refs/tags (e.g. release/1.2.0), adding one only touches its own folder
+	for dirpath, _, _ in os.walk(os.path.join(git_dir, "refs", "tags")):
+		mtimes.append(str(os.path.getmtime(dirpath)))
+
+	# hashed so the key stays plain ascii and compares equal to what json reads back, even for non ascii branch names
+	return hashlib.sha1("|".join([head, dirty, ref] + mtimes)).hexdigest()
+
+def _from_cache(value):
+	# json hands back unicode while versioneer returns git's output as utf-8 encoded str (which e.g. build_py writes to
+	# _version.py as is), so encode strings back the same way and leave anything else (like None) untouched
+	if isinstance(value, dict):
+		return dict((_from_cache(k), _from_cache(v)) for k, v in value.items())
+	if isinstance(value, unicode):
+		return value.encode("utf-8")
+	return value
+
+def _persistently_cached(name, f):
+	# persists the result of the git backed versioneer lookup f in build/.versioneer-cache.json, keyed by the current git
+	# state, falls back to calling f directly if the tree is not a git checkout or anything goes wrong with the cache
+	import json
+
+	def wrapper(source, root, verbose=False):
+		if not "key" in _versioneer_memo:
+			try:
+				_versioneer_memo["key"] = _versioneer_cache_key()
+			except (OSError, IOError, subprocess.CalledProcessError):
+				_versioneer_memo["key"] = None
+		key = _versioneer_memo["key"]
+
+		if key is None:
+			return f(source, root, verbose=verbose)
+
+		cache = dict()
+		try:
+			with open(VERSIONEER_CACHE_FILE) as cache_file:
+				cache = json.load(cache_file)
+		except (IOError, ValueError):
+			pass
+
+		entry = cache.get(key)
+		if not isinstance(entry, dict):
+			entry = dict()
+
+		if name in entry:
+			versions = _from_cache(entry[name])
+			if verbose: print("got %s version from cache %s" % (name, versions))
+			return versions
+
+		versions = f(source, root, verbose=verbose)
+		entry[name] = versions
+
+		try:
+			if not os.path.isdir(os.path.dirname(VERSIONEER_CACHE_FILE)):
+				os.makedirs(os.path.dirname(VERSIONEER_CACHE_FILE))
+			with open(VERSIONEER_CACHE_FILE, "w") as cache_file:
+				json.dump({key: entry}, cache_file)
+		except (IOError, OSError):
+			pass
+
+		return versions
+
+	return wrapper
+
+# only the lookups that need to run git get cached, versioneer still tries the expanded variables and _version.py first
+versioneer.versions_from_lookup = _persistently_cached("lookup", versioneer.versions_from_lookup)
+versioneer.versions_from_vcs = _persistently_cached("vcs", versioneer.versions_from_vcs)
+
+_versioneer_get_versions = versioneer.get_versions
+
+def _cached_get_versions(default=versioneer.DEFAULT, verbose=False):
+	# a single setup.py run asks for the version several times (params(), build, build_py, sdist) while neither the
+	# root folder, the lookup file nor the git state change in between, so remember the result for the process' life
+	if not "versions" in _versioneer_memo:
+		versions = _versioneer_get_versions(default=default, verbose=verbose)
+		if versions == default:
+			return versions
+		_versioneer_memo["versions"] = versions
+	return dict(_versioneer_memo["versions"])
+
+versioneer.get_versions = _cached_get_versions
 
 I18N_MAPPING_FILE = "babel.cfg"
 I18N_DOMAIN = "messages"
@@ -34,24 +143,29 @@ def package_data_dirs(source, sub_folders):
 
 
 def _recursively_handle_files(directory, file_matcher, folder_handler=None, file_handler=None):
-	applied_handler = False
+	# walk bottom up, that way every folder gets handed to the folder_handler only after all of its contents have been
+	# processed, without needing to recurse ourselves
+	handled_directories = set()
 
-	for filename in os.listdir(directory):
-		path = os.path.join(directory, filename)
+	for dirpath, _, filenames in os.walk(directory, topdown=False):
+		applied_handler = dirpath in handled_directories
 
-		if file_handler is not None and file_matcher(filename):
-			file_handler(path)
-			applied_handler = True
+		if file_handler is not None:
+			for filename in filenames:
+				if file_matcher(filename):
+					file_handler(os.path.join(dirpath, filename))
+					applied_handler = True
 
-		elif os.path.isdir(path):
-			sub_applied_handler = _recursively_handle_files(path, file_matcher, folder_handler=folder_handler, file_handler=file_handler)
-			if sub_applied_handler:
-				applied_handler = True
+		if dirpath == directory:
+			return applied_handler
 
-			if folder_handler is not None:
-				folder_handler(path, sub_applied_handler)
+		if applied_handler:
+			handled_directories.add(os.path.dirname(dirpath))
 
-	return applied_handler
+		if folder_handler is not None:
+			folder_handler(dirpath, applied_handler)
+
+	return False
 
 class CleanCommand(Command):
 	description = "clean build artifacts"
@@ -76,25 +190,33 @@ class CleanCommand(Command):
 			print "Deleting %s directory" % egg
 			shutil.rmtree(egg)
 
-		# pyc files
+		# pyc files, collecting the output and writing it in one go instead of once per file
+		messages = []
+
 		def delete_folder_if_empty(path, applied_handler):
 			if not applied_handler:
 				return
 			if len(os.listdir(path)) == 0:
 				shutil.rmtree(path)
-				print "Deleted %s since it was empty" % path
+				messages.append("Deleted %s since it was empty\n" % path)
 
 		def delete_file(path):
 			os.remove(path)
-			print "Deleted %s" % path
+			messages.append("Deleted %s\n" % path)
 
 		import fnmatch
-		_recursively_handle_files(
-			os.path.abspath("src"),
-			lambda name: fnmatch.fnmatch(name.lower(), "*.pyc"),
-			folder_handler=delete_folder_if_empty,
-			file_handler=delete_file
-		)
+		import re
+		pyc_matcher = re.compile(fnmatch.translate("*.pyc"), re.IGNORECASE).match
+		try:
+			_recursively_handle_files(
+				os.path.abspath("src"),
+				pyc_matcher,
+				folder_handler=delete_folder_if_empty,
+				file_handler=delete_file
+			)
+		finally:
+			sys.stdout.write("".join(messages))
+			sys.stdout.flush()
 
 
 class NewTranslation(Command):
@@ -113,10 +113,10 @@ class EventManager(object):
 			(event, payload) = self._queue.get(True)
 
 			eventListeners = self._registeredListeners[event]
-			self._logger.debug("Firing event: %s (Payload: %r)" % (event, payload))
+			self._logger.debug("Firing event: %s (Payload: %r)", event, payload)
 
 			for listener in eventListeners:
-				self._logger.debug("Sending action to %r" % listener)
+				self._logger.debug("Sending action to %r", listener)
 				try:
 					listener(event, payload)
 				except:
@@ -214,7 +214,7 @@ class DebugEventListener(GenericEventListener):
 
 	def eventCallback(self, event, payload):
 		GenericEventListener.eventCallback(self, event, payload)
-		self._logger.debug("Received event: %s (Payload: %r)" % (event, payload))
+		self._logger.debug("Received event: %s (Payload: %r)", event, payload)
 
 
 class CommandTrigger(GenericEventListener):
@@ -9,41 +9,54 @@ import os
 
 from octoprint.settings import settings
 from octoprint.plugin.core import (PluginInfo, PluginManager, Plugin)
-from octoprint.plugin.types import *
+from octoprint.plugin.types import (StartupPlugin, ShutdownPlugin, AssetPlugin, TemplatePlugin, SimpleApiPlugin,
+                                    BlueprintPlugin, SettingsPlugin, EventHandlerPlugin, SlicerPlugin, ProgressPlugin,
+                                    AppPlugin)
 
 # singleton
 _instance = None
 
+_DEFAULT_PLUGIN_TYPES = (StartupPlugin,
+                         ShutdownPlugin,
+                         TemplatePlugin,
+                         SettingsPlugin,
+                         SimpleApiPlugin,
+                         AssetPlugin,
+                         BlueprintPlugin,
+                         EventHandlerPlugin,
+                         SlicerPlugin,
+                         AppPlugin,
+                         ProgressPlugin)
+_DEFAULT_PLUGIN_ENTRY_POINTS = "octoprint.plugin"
+
 def plugin_manager(init=False, plugin_folders=None, plugin_types=None, plugin_entry_points=None, plugin_disabled_list=None):
+	# fast path, once initialized this is what nearly every call ends up doing
+	instance = _instance
+	if instance is not None:
+		return instance
+
+	if not init:
+		raise ValueError("Plugin Manager not initialized yet")
+	return _init_plugin_manager(plugin_folders=plugin_folders, plugin_types=plugin_types, plugin_entry_points=plugin_entry_points, plugin_disabled_list=plugin_disabled_list)
+
+
+def _init_plugin_manager(plugin_folders=None, plugin_types=None, plugin_entry_points=None, plugin_disabled_list=None):
 	global _instance
-	if _instance is None:
-		if init:
-			if plugin_folders is None:
-				plugin_folders = (settings().getBaseFolder("plugins"), os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "plugins")))
-			if plugin_types is None:
-				plugin_types = [StartupPlugin,
-				                ShutdownPlugin,
-				                TemplatePlugin,
-				                SettingsPlugin,
-				                SimpleApiPlugin,
-				                AssetPlugin,
-				                BlueprintPlugin,
-				                EventHandlerPlugin,
-				                SlicerPlugin,
-				                AppPlugin,
-				                ProgressPlugin]
-			if plugin_entry_points is None:
-				plugin_entry_points = "octoprint.plugin"
-			if plugin_disabled_list is None:
-				all_plugin_settings = settings().get(["plugins"])
-				plugin_disabled_list = []
-				for key in all_plugin_settings:
-					if "enabled" in all_plugin_settings[key] and not all_plugin_settings[key]:
-						plugin_disabled_list.append(key)
-
-			_instance = PluginManager(plugin_folders, plugin_types, plugin_entry_points, plugin_disabled_list=plugin_disabled_list)
-		else:
-			raise ValueError("Plugin Manager not initialized yet")
+
+	if plugin_folders is None:
+		plugin_folders = (settings().getBaseFolder("plugins"), os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "plugins")))
+	if plugin_types is None:
+		plugin_types = _DEFAULT_PLUGIN_TYPES
+	if plugin_entry_points is None:
+		plugin_entry_points = _DEFAULT_PLUGIN_ENTRY_POINTS
+	if plugin_disabled_list is None:
+		all_plugin_settings = settings().get(["plugins"])
+		plugin_disabled_list = []
+		for key in all_plugin_settings:
+			if "enabled" in all_plugin_settings[key] and not all_plugin_settings[key]:
+				plugin_disabled_list.append(key)
+
+	_instance = PluginManager(plugin_folders, plugin_types, plugin_entry_points, plugin_disabled_list=plugin_disabled_list)
 	return _instance
 
 
@@ -61,40 +74,55 @@ def call_plugin(types, method, args=None, kwargs=None, callback=None):
 
 	plugins = plugin_manager().get_implementations(*types)
 	for name, plugin in plugins.items():
-		if hasattr(plugin, method):
-			result = getattr(plugin, method)(*args, **kwargs)
+		plugin_method = getattr(plugin, method, None)
+		if plugin_method is not None:
+			result = plugin_method(*args, **kwargs)
 			if callback:
 				callback(name, plugin, result)
 
 
 class PluginSettings(object):
+	__slots__ = ("settings", "plugin_key", "defaults", "access_methods", "_path_prefix",
+	             "globalGet", "globalGetInt", "globalGetFloat", "globalGetBoolean",
+	             "globalSet", "globalSetInt", "globalSetFloat", "globalSetBoolean",
+	             "globalGetBaseFolder",
+	             "get", "getInt", "getFloat", "getBoolean",
+	             "set", "setInt", "setFloat", "setBoolean")
+
 	def __init__(self, settings, plugin_key, defaults=None):
 		self.settings = settings
+
+		# the global accessors are plain pass-throughs, so just hand out the settings' bound methods
+		self.globalGet = settings.get
+		self.globalGetInt = settings.getInt
+		self.globalGetFloat = settings.getFloat
+		self.globalGetBoolean = settings.getBoolean
+		self.globalSet = settings.set
+		self.globalSetInt = settings.setInt
+		self.globalSetFloat = settings.setFloat
+		self.globalSetBoolean = settings.setBoolean
+		self.globalGetBaseFolder = settings.getBaseFolder
+
 		self.plugin_key = plugin_key
 
 		if defaults is None:
 			defaults = dict()
-		self.defaults = dict(plugins=dict())
-		self.defaults["plugins"][plugin_key] = defaults
+		self.defaults = {"plugins": {plugin_key: defaults}}
+
+		# Settings.get/set consume the path they are handed, so every call still needs a fresh list, but at least the
+		# prefix itself doesn't have to be rebuilt each time
+		self._path_prefix = ['plugins', self.plugin_key]
 
 		def prefix_path(path):
-			return ['plugins', self.plugin_key] + path
+			return self._path_prefix + path
 
 		def prefix_path_in_args(args, index=0):
-			result = []
 			if index == 0:
-				result.append(prefix_path(args[0]))
-				result.extend(args[1:])
-			else:
-				args_before = args[:index - 1]
-				args_after = args[index + 1:]
-				result.extend(args_before)
-				result.append(prefix_path(args[index]))
-				result.extend(args_after)
-			return result
+				return (prefix_path(args[0]),) + args[1:]
+			return args[:index] + (prefix_path(args[index]),) + args[index + 1:]
 
 		def add_defaults_to_kwargs(kwargs):
-			kwargs.update(dict(defaults=self.defaults))
+			kwargs["defaults"] = self.defaults
 			return kwargs
 
 		self.access_methods = {
@@ -108,32 +136,14 @@ class PluginSettings(object):
 			'setBoolean': (lambda args: prefix_path_in_args(args), lambda kwargs: add_defaults_to_kwargs(kwargs))
 		}
 
-	def globalGet(self, path):
-		return self.settings.get(path)
+		# bind the prefixing proxies once instead of creating a new one through __getattr__ on every single access
+		def create_access_proxy(method, args_mapper, kwargs_mapper):
+			return lambda *args, **kwargs: method(*args_mapper(args), **kwargs_mapper(kwargs))
 
-	def globalGetInt(self, path):
-		return self.settings.getInt(path)
-
-	def globalGetFloat(self, path):
-		return self.settings.getFloat(path)
-
-	def globalGetBoolean(self, path):
-		return self.settings.getBoolean(path)
-
-	def globalSet(self, path, value):
-		self.settings.set(path, value)
-
-	def globalSetInt(self, path, value):
-		self.settings.setInt(path, value)
-
-	def globalSetFloat(self, path, value):
-		self.settings.setFloat(path, value)
-
-	def globalSetBoolean(self, path, value):
-		self.settings.setBoolean(path, value)
-
-	def globalGetBaseFolder(self, folder_type):
-		return self.settings.getBaseFolder(folder_type)
+		for name, (args_mapper, kwargs_mapper) in self.access_methods.items():
+			method = getattr(settings, name, None)
+			if callable(method):
+				setattr(self, name, create_access_proxy(method, args_mapper, kwargs_mapper))
 
 	def getPluginLogfilePath(self, postfix=None):
 		filename = "plugin_" + self.plugin_key
@@ -143,10 +153,4 @@ class PluginSettings(object):
 		return os.path.join(self.settings.getBaseFolder("logs"), filename)
 
 	def __getattr__(self, item):
-		if item in self.access_methods and hasattr(self.settings, item) and callable(getattr(self.settings, item)):
-			orig_item = getattr(self.settings, item)
-			args_mapper, kwargs_mapper = self.access_methods[item]
-
-			return lambda *args, **kwargs: orig_item(*args_mapper(args), **kwargs_mapper(kwargs))
-		else:
-			return getattr(self.settings, item)
+		return getattr(self.settings, item)
@@ -110,6 +110,7 @@ class PluginManager(object):
 		self.plugins = dict()
 		self.plugin_hooks = defaultdict(list)
 		self.plugin_implementations = defaultdict(list)
+		self.plugin_implementations_by_type = dict()
 
 		self.registered_clients = []
 
@@ -225,6 +226,9 @@ class PluginManager(object):
 				implementations = plugin.get_implementations(plugin_type)
 				self.plugin_implementations[plugin_type] += ( (name, implementation) for implementation in implementations )
 
+		# implementations changed, drop anything get_implementations cached so far
+		self.plugin_implementations_by_type.clear()
+
 		self.log_registered_plugins()
 
 	def log_registered_plugins(self):
@@ -244,18 +248,23 @@ class PluginManager(object):
 		return {hook[0]: hook[1] for hook in self.plugin_hooks[hook]}
 
 	def get_implementations(self, *types):
-		result = None
+		# call_plugin and friends ask for the same type combinations over and over again (e.g. for every fired
+		# event), so the lookup result is cached per combination until the plugins get reloaded
+		if not types in self.plugin_implementations_by_type:
+			result = None
+
+			for t in types:
+				implementations = self.plugin_implementations[t]
+				if result is None:
+					result = set(implementations)
+				else:
+					result = result.intersection(implementations)
 
-		for t in types:
-			implementations = self.plugin_implementations[t]
 			if result is None:
-				result = set(implementations)
-			else:
-				result = result.intersection(implementations)
+				result = []
+			self.plugin_implementations_by_type[types] = {impl[0]: impl[1] for impl in result}
 
-		if result is None:
-			return dict()
-		return {impl[0]: impl[1] for impl in result}
+		return dict(self.plugin_implementations_by_type[types])
 
 	def get_helpers(self, name, *helpers):
 		if not name in self.plugins:
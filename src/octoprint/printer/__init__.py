@@ -7,7 +7,6 @@ __license__ = 'GNU Affero General Public License http://www.gnu.org/licenses/agp
 
 import time
 import threading
-import copy
 import os
 import re
 import logging
@@ -192,8 +191,11 @@ class Printer():
 			except: self._logger.exception("Exception while adding printer message")
 
 	def _sendCurrentDataCallbacks(self, data):
+		# the nested state, job, progress and offset structures are never modified in place but only ever replaced as a
+		# whole, so they can be shared between all callbacks. Only the top level dict needs to be copied, since callbacks
+		# add their own entries to it
 		for callback in self._callbacks:
-			try: callback.sendCurrentData(copy.deepcopy(data))
+			try: callback.sendCurrentData(dict(data))
 			except: self._logger.exception("Exception while pushing current data")
 
 	def _sendTriggerUpdateCallbacks(self, type):
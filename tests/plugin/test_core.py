@@ -67,3 +67,31 @@ class PluginTestCase(unittest.TestCase):
 		implementations = self.plugin_manager.get_implementations(octoprint.plugin.StartupPlugin, octoprint.plugin.SettingsPlugin)
 		self.assertEquals(1, len(implementations))
 		self.assertTrue('mixed_plugin' in implementations)
+
+	def test_get_implementation_cached(self):
+		implementations = self.plugin_manager.get_implementations(octoprint.plugin.StartupPlugin)
+		self.assertEquals(2, len(implementations))
+
+		# modifying the returned dict must not affect the cached lookup result
+		del implementations['mixed_plugin']
+
+		implementations = self.plugin_manager.get_implementations(octoprint.plugin.StartupPlugin)
+		self.assertEquals(2, len(implementations))
+		self.assertTrue('startup_plugin' in implementations)
+		self.assertTrue('mixed_plugin' in implementations)
+
+	def test_get_implementation_cache_invalidated_on_reload(self):
+		implementations = self.plugin_manager.get_implementations(octoprint.plugin.StartupPlugin)
+		self.assertEquals(2, len(implementations))
+
+		# reload_plugins adds to the registered implementations, so start over with an empty registry
+		from collections import defaultdict
+		self.plugin_manager.plugin_hooks = defaultdict(list)
+		self.plugin_manager.plugin_implementations = defaultdict(list)
+		self.plugin_manager.plugin_disabled_list = ["mixed_plugin"]
+		self.plugin_manager.reload_plugins()
+
+		implementations = self.plugin_manager.get_implementations(octoprint.plugin.StartupPlugin)
+		self.assertEquals(1, len(implementations))
+		self.assertTrue('startup_plugin' in implementations)
+		self.assertFalse('mixed_plugin' in implementations)
@@ -0,0 +1,111 @@
+import unittest
+
+import octoprint.plugin
+
+
+class StubSettings(object):
+
+	some_attribute = "some_value"
+
+	def __init__(self):
+		self.calls = []
+
+	def _record(self, name, *args, **kwargs):
+		self.calls.append((name, args, kwargs))
+		return name
+
+	def get(self, *args, **kwargs):
+		return self._record("get", *args, **kwargs)
+
+	def getInt(self, *args, **kwargs):
+		return self._record("getInt", *args, **kwargs)
+
+	def getFloat(self, *args, **kwargs):
+		return self._record("getFloat", *args, **kwargs)
+
+	def getBoolean(self, *args, **kwargs):
+		return self._record("getBoolean", *args, **kwargs)
+
+	def set(self, *args, **kwargs):
+		return self._record("set", *args, **kwargs)
+
+	def setInt(self, *args, **kwargs):
+		return self._record("setInt", *args, **kwargs)
+
+	def setFloat(self, *args, **kwargs):
+		return self._record("setFloat", *args, **kwargs)
+
+	def setBoolean(self, *args, **kwargs):
+		return self._record("setBoolean", *args, **kwargs)
+
+	def getBaseFolder(self, *args, **kwargs):
+		return self._record("getBaseFolder", *args, **kwargs)
+
+
+class PluginSettingsTestCase(unittest.TestCase):
+
+	def setUp(self):
+		self.settings = StubSettings()
+		self.defaults = dict(some_key="some_value")
+		self.plugin_settings = octoprint.plugin.PluginSettings(self.settings, "test_plugin", defaults=self.defaults)
+
+	def test_defaults_injected(self):
+		self.plugin_settings.get(["some_key"])
+
+		name, args, kwargs = self.settings.calls[-1]
+		self.assertEquals("get", name)
+		self.assertEquals(dict(defaults=dict(plugins=dict(test_plugin=self.defaults))), kwargs)
+
+	def test_defaults_override_caller_defaults(self):
+		self.plugin_settings.get(["some_key"], defaults=dict(other_key="other_value"))
+
+		name, args, kwargs = self.settings.calls[-1]
+		self.assertEquals(dict(plugins=dict(test_plugin=self.defaults)), kwargs["defaults"])
+
+	def test_path_prefixed(self):
+		for method in ("get", "getInt", "getFloat", "getBoolean"):
+			result = getattr(self.plugin_settings, method)(["some_key"])
+			self.assertEquals(method, result)
+
+			name, args, kwargs = self.settings.calls[-1]
+			self.assertEquals(method, name)
+			self.assertEquals((["plugins", "test_plugin", "some_key"],), args)
+
+		for method in ("set", "setInt", "setFloat", "setBoolean"):
+			getattr(self.plugin_settings, method)(["some_key"], "new_value", force=True)
+
+			name, args, kwargs = self.settings.calls[-1]
+			self.assertEquals(method, name)
+			self.assertEquals((["plugins", "test_plugin", "some_key"], "new_value"), args)
+			self.assertEquals(dict(force=True, defaults=dict(plugins=dict(test_plugin=self.defaults))), kwargs)
+
+	def test_path_fresh_per_call(self):
+		# Settings consumes the path it is handed, that must not affect subsequent calls
+		self.plugin_settings.get(["some_key"])
+		self.settings.calls[-1][1][0][:] = []
+
+		self.plugin_settings.get(["other_key"])
+		name, args, kwargs = self.settings.calls[-1]
+		self.assertEquals((["plugins", "test_plugin", "other_key"],), args)
+
+	def test_global_passthrough(self):
+		for method, target in (("globalGet", "get"), ("globalGetInt", "getInt"), ("globalGetFloat", "getFloat"),
+		                       ("globalGetBoolean", "getBoolean"), ("globalGetBaseFolder", "getBaseFolder")):
+			result = getattr(self.plugin_settings, method)(["some", "path"])
+			self.assertEquals(target, result)
+			self.assertEquals((target, (["some", "path"],), dict()), self.settings.calls[-1])
+
+		for method, target in (("globalSet", "set"), ("globalSetInt", "setInt"), ("globalSetFloat", "setFloat"),
+		                       ("globalSetBoolean", "setBoolean")):
+			getattr(self.plugin_settings, method)(["some", "path"], "value")
+			self.assertEquals((target, (["some", "path"], "value"), dict()), self.settings.calls[-1])
+
+	def test_getattr_fallthrough(self):
+		self.assertEquals("some_value", self.plugin_settings.some_attribute)
+		self.assertEquals(self.settings.calls, self.plugin_settings.calls)
+		self.assertRaises(AttributeError, getattr, self.plugin_settings, "unknown_attribute")
+
+	def test_plugin_logfile_path(self):
+		self.assertEquals("getBaseFolder/plugin_test_plugin.log", self.plugin_settings.getPluginLogfilePath())
+		self.assertEquals("getBaseFolder/plugin_test_plugin_postfix.log", self.plugin_settings.getPluginLogfilePath(postfix="postfix"))
+		self.assertEquals(("getBaseFolder", ("logs",), dict()), self.settings.calls[-1])
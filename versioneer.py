@@ -835,6 +835,41 @@ def write_to_version_file(filename, versions):
     f.close()
     print("set %s to '%s'" % (filename, versions["version"]))
 
+def update_version_file(filename, versions):
+    # only touch the file if its contents actually change, so that anything
+    # tracking its mtime doesn't get rebuilt for nothing, and replace it
+    # atomically via a temporary file in the same directory
+    import tempfile
+    contents = SHORT_VERSION_PY % versions
+    if os.path.exists(filename):
+        f = open(filename)
+        try:
+            if f.read() == contents:
+                print("%s is up to date" % filename)
+                return False
+        finally:
+            f.close()
+
+    print("UPDATING %s" % filename)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filename) or ".")
+    try:
+        f = os.fdopen(fd, "w")
+        f.write(contents)
+        f.close()
+        # mkstemp creates the file as 0600, apply the usual umask based mode instead
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)
+        if os.path.exists(filename) and sys.platform == "win32":
+            # os.rename won't replace existing files on Windows
+            os.unlink(filename)
+        os.rename(tmp, filename)
+    except:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return True
+
 def get_root():
     try:
         return os.path.dirname(os.path.abspath(__file__))
@@ -946,12 +981,7 @@ class cmd_build_py(_build_py):
         # now locate _version.py in the new build/ directory and replace it
         # with an updated value
         target_versionfile = os.path.join(self.build_lib, versionfile_build)
-        print("UPDATING %s" % target_versionfile)
-        if os.path.exists(target_versionfile):
-            os.unlink(target_versionfile)
-        f = open(target_versionfile, "w")
-        f.write(SHORT_VERSION_PY % versions)
-        f.close()
+        update_version_file(target_versionfile, versions)
 
 class cmd_build(_build):
     def run(self):
@@ -961,12 +991,7 @@ class cmd_build(_build):
         # now locate _version.py in the new build/ directory and replace it
         # with an updated value
         target_versionfile = os.path.join(self.build_lib, versionfile_build)
-        print("UPDATING %s" % target_versionfile)
-        if os.path.exists(target_versionfile):
-            os.unlink(target_versionfile)
-        f = open(target_versionfile, "w")
-        f.write(SHORT_VERSION_PY % versions)
-        f.close()
+        update_version_file(target_versionfile, versions)
 
 if 'cx_Freeze' in sys.modules:  # cx_freeze enabled?
     from cx_Freeze.dist import build_exe as _build_exe